@@ -1,36 +1,49 @@
 import os
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
-import json
 import argparse
+import copy
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 import datetime
 
+import orjson
+import pandas as pd
+
 from scraper.selenium_scraper import SeleniumScraper
 from scraper.requests_scraper import RequestsScraper
+from scraper.aiohttp_scraper import AiohttpScraper
 from processor.data_processor import DataProcessor
 
-def load_config(portal: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _load_all_configs() -> Dict[str, Any]:
     """
-    Loads the configuration for the given portal.
+    Reads and parses configuration.json once; later calls reuse the result.
     """
     config_path = Path(__file__).parent / "config" / "configuration.json"
+    return orjson.loads(config_path.read_bytes())["portals"]
+
+def load_config(portal: str) -> Dict[str, Any]:
+    """
+    Loads the configuration for the given portal. Returns a copy, so callers
+    can't change the cached configuration seen by later runs.
+    """
     try:
-        with open(config_path, "r") as f:
-            return json.load(f)["portals"][portal]
+        return copy.deepcopy(_load_all_configs()[portal])
     except Exception as e:
         raise Exception(f"Error loading configuration for {portal}: {e}")
 
-def run_pipeline(portal: str, sector: str, max_pages: int, headless: bool = True):
+def run_pipeline(portal: str, sector: str, max_pages: int, headless: bool = True, output_format: str = "csv"):
     """
     Args:
         portal (str): Name of the portal to scrape
         sector (str): Name of the sector to scrape
         max_pages (int): Max pages to scrape
         headless (bool, optional): Whether to run the browser in headless mode. Defaults to True.
+        output_format (str, optional): Output file format, "csv" or "parquet". Defaults to "csv".
     """
     start_time = datetime.datetime.now()
     config = load_config(portal)
@@ -48,84 +61,89 @@ def run_pipeline(portal: str, sector: str, max_pages: int, headless: bool = True
         scraper = SeleniumScraper(**scraper_params)
     elif config['engine'] == 'requests':
         scraper = RequestsScraper(**scraper_params)
+    elif config['engine'] == 'aiohttp':
+        scraper = AiohttpScraper(**scraper_params)
     else:
         raise ValueError(f"Unsupported engine: {config['engine']}")
     # --------------------
     
-    try:
-        scraped_data = scraper.scrape()
-        processor = DataProcessor()
-
-        output_dir = Path("data")
-        output_dir.mkdir(exist_ok=True)
-
-        # 1. Save company profile links, links_<sector>.csv
-        links_filename = output_dir / f"links_{sector}.csv"
-        profile_links = [{"profile_url": url} for url in scraped_data["company_profiles"]]
-        processor.save_to_csv(profile_links, str(links_filename))
-        print(f"Successfully saved {len(profile_links)} profile links to {links_filename}")
-
-        # Combine all scraped data into a structured list of records
-        records = []
-        for i in range(len(scraped_data["details"])):
-            details = scraped_data["details"][i]
-            emails = scraped_data["emails"][i].get("emails", [])
-            profile_url = scraped_data["company_profiles"][i]
-            
-            records.append({
-                "Name": details.get("name"),
-                "Country": details.get("country"),
-                "Address": details.get("address"),
-                "Website": details.get("website"),
-                "Email": ", ".join(emails),
-                "Profile_URL": profile_url
-            })
-
-        # 2. Save emails with company name and country, emails_<sector>.csv
-        emails_filename = output_dir / f"emails_{sector}.csv"
-        email_records = []
-        for record in records:
-            if record.get("Email"):
-                email_records.append({
-                    "Name": record.get("Name"),
-                    "Country": record.get("Country"),
-                    "Email": record.get("Email")
-                })
-        processor.save_to_csv(email_records, str(emails_filename))
-        print(f"Successfully saved {len(email_records)} records with emails to {emails_filename}")
-
-        # 3. Process and save detailed data, detailed_<sector>.csv
-        detailed_filename = output_dir / f"detailed_{sector}.csv"
-        processed_data = processor.process_scraped_data(records)
-        processor.save_to_csv(processed_data, str(detailed_filename))
-        print(f"Successfully saved {len(processed_data)} processed records to {detailed_filename}")
-
-        stats = processor.get_data_statistics(processed_data)
-        print(f"\n--- Data Statistics for {detailed_filename} ---")
-        for key, value in stats.items():
-            print(f"{key}: {value}")
-        print("--------------------------------------------------\n")
-
-        # 4. Generate and save summary log, summary_<sector>.log
-        end_time = datetime.datetime.now()
-        duration = end_time - start_time
-        summary_log_path = output_dir / f"summary_{sector}.log"
-        processor.generate_summary_log(
-            raw_details=scraped_data["details"],
-            raw_emails=scraped_data["emails"],
-            pages_scraped=scraped_data["pages_scraped"],
-            log_path=str(summary_log_path),
-            start_time=start_time,
-            end_time=end_time,
-            duration=duration
-        )
-        print(f"Successfully generated summary log at {summary_log_path}")
+    scraped_data = scraper.scrape()
+    processor = DataProcessor()
+    if output_format == "parquet":
+        save_records = processor.save_to_parquet
 
-    finally:
-        # Close the driver only if it's a selenium scraper and the handler exists
-        if config['engine'] == 'selenium' and hasattr(scraper, 'handler'):
-            scraper.handler.close_driver()
-        # No need for an else, as RequestsScraper doesn't need cleanup
+        def save_simple(records, filename, schema):
+            return processor.save_to_parquet(records, filename, schema=schema)
+    else:
+        # The links/emails columns are fixed, so they're written without save_to_csv's column lookup
+        save_records = processor.save_to_csv
+
+        def save_simple(records, filename, schema):
+            return processor.save_simple_csv(records, filename, schema.names)
+
+    output_dir = Path("data")
+    output_dir.mkdir(exist_ok=True)
+
+    # 1. Save company profile links, links_<sector>.<format>
+    links_filename = output_dir / f"links_{sector}.{output_format}"
+    profile_links = [{"profile_url": url} for url in scraped_data["company_profiles"]]
+    save_simple(profile_links, str(links_filename), processor.LINKS_SCHEMA)
+    print(f"Successfully saved {len(profile_links)} profile links to {links_filename}")
+
+    # Combine all scraped data in one pass, collecting the email subset alongside.
+    # Large runs are processed with pandas, so their frame is built from columns;
+    # smaller ones stay a list of row dicts.
+    vectorize = len(scraped_data["details"]) > processor.VECTORIZE_THRESHOLD
+    fields = processor.DETAILED_SCHEMA.names
+    columns = {field: [] for field in fields}
+    records = []
+    email_records = []
+    for details, emails, profile_url in zip(scraped_data["details"], scraped_data["emails"], scraped_data["company_profiles"]):
+        email = ", ".join(emails.get("emails", []))
+        row = (details.get("name"), details.get("country"), details.get("address"),
+               details.get("website"), email, profile_url)
+        if vectorize:
+            for column, value in zip(columns.values(), row):
+                column.append(value)
+        else:
+            records.append(dict(zip(fields, row)))
+        if email:
+            email_records.append({"Name": row[0], "Country": row[1], "Email": email})
+    if vectorize:
+        records = pd.DataFrame(columns)
+
+    # 2. Save emails with company name and country, emails_<sector>.<format>
+    emails_filename = output_dir / f"emails_{sector}.{output_format}"
+    save_simple(email_records, str(emails_filename), processor.EMAILS_SCHEMA)
+    print(f"Successfully saved {len(email_records)} records with emails to {emails_filename}")
+
+    # 3. Process and save detailed data, detailed_<sector>.<format>
+    detailed_filename = output_dir / f"detailed_{sector}.{output_format}"
+    # records is not used again, so it can be cleaned in place
+    processed_data = processor.process_scraped_data(records, inplace=True)
+    save_records(processed_data, str(detailed_filename), schema=processor.DETAILED_SCHEMA)
+    print(f"Successfully saved {len(processed_data)} processed records to {detailed_filename}")
+
+    stats = processor.get_data_statistics(processed_data, already_deduped=True)
+    print(f"\n--- Data Statistics for {detailed_filename} ---")
+    for key, value in stats.items():
+        print(f"{key}: {value}")
+    print("--------------------------------------------------\n")
+
+    # 4. Generate and save summary log, summary_<sector>.log
+    end_time = datetime.datetime.now()
+    duration = end_time - start_time
+    summary_log_path = output_dir / f"summary_{sector}.log"
+    processor.generate_summary_log(
+        raw_details=scraped_data["details"],
+        raw_emails=scraped_data["emails"],
+        pages_scraped=scraped_data["pages_scraped"],
+        log_path=str(summary_log_path),
+        start_time=start_time,
+        end_time=end_time,
+        duration=duration
+    )
+    print(f"Successfully generated summary log at {summary_log_path}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scraper Pipeline")
@@ -133,6 +151,7 @@ if __name__ == "__main__":
     parser.add_argument("--sector", type=str, required=True, help="Name of the sector to scrape")
     parser.add_argument("--max_pages", type=int, required=True, help="Max number of pages to scrape")
     parser.add_argument("--no-headless", action="store_false", dest="headless", help="Disable headless mode for the browser")
+    parser.add_argument("--output_format", type=str, choices=["csv", "parquet"], default="csv", help="Output file format (default: csv)")
     
     args = parser.parse_args()
 
@@ -143,7 +162,8 @@ if __name__ == "__main__":
             portal=args.portal,
             sector=args.sector,
             max_pages=args.max_pages,
-            headless=args.headless
+            headless=args.headless,
+            output_format=args.output_format
         )
     except Exception as e:
         logging.error(f"An error occurred during the pipeline execution: {e}")
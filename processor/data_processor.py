@@ -2,18 +2,112 @@
 Data processor class for cleaning and processing scraped data.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import csv
 import logging
-from typing import List, Dict, Any, Set
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Set, Union
 import re
-from urllib.parse import urlparse
-import validators
+from urllib.parse import urlsplit
+
+
+# Noise prefixes/suffixes stripped from company names, compiled once at import
+_PREFIX_RE = re.compile(r'^(Company:|Business:|Enterprise:)\s*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'\s*-\s*(Company|Business|Enterprise)$', re.IGNORECASE)
+_PIPE_RE = re.compile(r'\s*\|\s*.*$')  # Remove everything after |
+_NOISE_PATTERNS = [_PREFIX_RE, _SUFFIX_RE, _PIPE_RE]
+_WS_RE = re.compile(r'\s+')
+# Only rejects values that aren't shaped like an address at all; emails coming from
+# EmailExtractor already passed its stricter _STRICT_EMAIL_RE
+_LOOSE_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+# Validation is deterministic per input and the same corporate domains and
+# emails recur across records, so results are memoized. These are free
+# functions because lru_cache on a method would also key on (and keep) self.
+@lru_cache(maxsize=65536)
+def _is_valid_email(email: str) -> bool:
+    return _LOOSE_EMAIL_RE.match(email) is not None
+
+
+@lru_cache(maxsize=65536)
+def _is_valid_url(url: str) -> bool:
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
 
 
 class DataProcessor:
     
+    # Country mapping for common variations
+    COUNTRY_MAPPING = {
+        'DE': 'Germany',
+        'FR': 'France',
+        'IT': 'Italy',
+        'ES': 'Spain',
+        'GB': 'United Kingdom',
+        'UK': 'United Kingdom',
+        'NL': 'Netherlands',
+        'BE': 'Belgium',
+        'AT': 'Austria',
+        'CH': 'Switzerland',
+        'PL': 'Poland',
+        'CZ': 'Czech Republic',
+        'HU': 'Hungary',
+        'RO': 'Romania',
+        'BG': 'Bulgaria',
+        'HR': 'Croatia',
+        'SI': 'Slovenia',
+        'SK': 'Slovakia',
+        'PT': 'Portugal',
+        'GR': 'Greece',
+        'DK': 'Denmark',
+        'SE': 'Sweden',
+        'NO': 'Norway',
+        'FI': 'Finland',
+        'IE': 'Ireland',
+        'LU': 'Luxembourg',
+        'EE': 'Estonia',
+        'LV': 'Latvia',
+        'LT': 'Lithuania'
+    }
+    
+    # Raw values that mean a name or country is missing; names are also rejected as 'null'
+    PLACEHOLDER_VALUES = frozenset({'unknown', 'n/a', ''})
+    INVALID_NAMES = PLACEHOLDER_VALUES | {'null'}
+    
+    # Above this many records, deduplication hashes keys with pandas instead of a Python loop
+    VECTORIZE_THRESHOLD = 500
+    
+    # Fixed Arrow schemas for the pipeline outputs; passing these to the writers
+    # skips per-cell type inference
+    LINKS_SCHEMA = pa.schema([('profile_url', pa.string())])
+    EMAILS_SCHEMA = pa.schema([
+        ('Name', pa.string()),
+        ('Country', pa.string()),
+        ('Email', pa.string()),
+    ])
+    DETAILED_SCHEMA = pa.schema([
+        ('Name', pa.string()),
+        ('Country', pa.string()),
+        ('Address', pa.string()),
+        ('Website', pa.string()),
+        ('Email', pa.string()),
+        ('Profile_URL', pa.string()),
+    ])
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Raw country string -> cleaned name; only a handful of distinct values
+        # recur across all records, so each is normalized once
+        self._country_cache: Dict[str, str] = {}
         
     def clean_company_name(self, name: str) -> str:
         """
@@ -25,21 +119,20 @@ class DataProcessor:
         Returns:
             Cleaned company name
         """
-        if not name or name.lower() in ['unknown', 'n/a', '']:
+        if not name or name.lower() in self.PLACEHOLDER_VALUES:
             return 'Unknown'
             
         # Remove extra whitespace
-        name = ' '.join(name.split())
+        name = _WS_RE.sub(' ', name).strip()
         
-        # Remove common suffixes and prefixes that might be noise
-        noise_patterns = [
-            r'^(Company:|Business:|Enterprise:)\s*',
-            r'\s*-\s*(Company|Business|Enterprise)$',
-            r'\s*\|\s*.*$',  # Remove everything after |
-        ]
-        
-        for pattern in noise_patterns:
-            name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+        # Remove common suffixes and prefixes that might be noise. Each pattern
+        # needs a marker character, so most names skip the regex engine entirely.
+        if ':' in name[:11]:  # len('Enterprise:')
+            name = _PREFIX_RE.sub('', name)
+        if '-' in name:
+            name = _SUFFIX_RE.sub('', name)
+        if '|' in name:
+            name = _PIPE_RE.sub('', name)
             
         return name.strip()
         
@@ -53,47 +146,20 @@ class DataProcessor:
         Returns:
             Cleaned country name
         """
-        if not country or country.lower() in ['unknown', 'n/a', '']:
+        cleaned = self._country_cache.get(country)
+        if cleaned is None:
+            cleaned = self._country_cache[country] = self._normalize_country(country)
+        return cleaned
+        
+    def _normalize_country(self, country: str) -> str:
+        if not country or country.lower() in self.PLACEHOLDER_VALUES:
             return 'Unknown'
             
-        # Country mapping for common variations
-        country_mapping = {
-            'DE': 'Germany',
-            'FR': 'France', 
-            'IT': 'Italy',
-            'ES': 'Spain',
-            'GB': 'United Kingdom',
-            'UK': 'United Kingdom',
-            'NL': 'Netherlands',
-            'BE': 'Belgium',
-            'AT': 'Austria',
-            'CH': 'Switzerland',
-            'PL': 'Poland',
-            'CZ': 'Czech Republic',
-            'HU': 'Hungary',
-            'RO': 'Romania',
-            'BG': 'Bulgaria',
-            'HR': 'Croatia',
-            'SI': 'Slovenia',
-            'SK': 'Slovakia',
-            'PT': 'Portugal',
-            'GR': 'Greece',
-            'DK': 'Denmark',
-            'SE': 'Sweden',
-            'NO': 'Norway',
-            'FI': 'Finland',
-            'IE': 'Ireland',
-            'LU': 'Luxembourg',
-            'EE': 'Estonia',
-            'LV': 'Latvia',
-            'LT': 'Lithuania'
-        }
-        
         country = country.strip()
         
         # Check if it's a country code
-        if country.upper() in country_mapping:
-            return country_mapping[country.upper()]
+        if country.upper() in self.COUNTRY_MAPPING:
+            return self.COUNTRY_MAPPING[country.upper()]
             
         # Capitalize properly
         return country.title()
@@ -111,8 +177,7 @@ class DataProcessor:
         if not email:
             return False
             
-        # Use validators library
-        return validators.email(email)
+        return _is_valid_email(email)
         
     def validate_url(self, url: str) -> bool:
         """
@@ -127,7 +192,7 @@ class DataProcessor:
         if not url:
             return False
             
-        return validators.url(url)
+        return _is_valid_url(url)
         
     def deduplicate_records(self, records: List[Dict[str, Any]], 
                           key_fields: List[str] = None) -> List[Dict[str, Any]]:
@@ -145,23 +210,23 @@ class DataProcessor:
         if key_fields is None:
             key_fields = ['Name', 'Email']
             
-        seen = set()
-        deduplicated = []
-        
-        for record in records:
-            # Create a key from the specified fields
-            key_values = []
-            for field in key_fields:
-                value = record.get(field, '').strip().lower()
-                key_values.append(value)
-            key = tuple(key_values)
-            
-            if key not in seen:
-                seen.add(key)
-                deduplicated.append(record)
-            else:
-                self.logger.debug(f"Duplicate record found: {key}")
+        if len(records) > self.VECTORIZE_THRESHOLD:
+            # Normalize the key columns column-wise and let pandas' hashtable find
+            # repeats; the original dicts are kept so None values survive untouched
+            df = pd.DataFrame(records, columns=key_fields)
+            norm = df.apply(lambda col: col.fillna('').str.strip().str.lower())
+            keep = ~norm.duplicated(keep='first')
+            deduplicated = [record for record, is_first in zip(records, keep) if is_first]
+        else:
+            # dicts keep insertion order, so the first record seen for each key wins
+            by_key = {}
+            
+            for record in records:
+                # Create a key from the specified fields
+                key = tuple((record.get(field) or '').strip().lower() for field in key_fields)
+                by_key.setdefault(key, record)
                 
+            deduplicated = list(by_key.values())
         self.logger.info(f"Removed {len(records) - len(deduplicated)} duplicate records")
         return deduplicated
         
@@ -174,6 +239,9 @@ class DataProcessor:
             List of valid records
         """
         valid_records = []
+        # An invalid source URL is only ever logged, so skip validating it when
+        # debug output is off
+        check_source_url = self.logger.isEnabledFor(logging.DEBUG)
         
         for record in records:
             is_valid = True
@@ -181,12 +249,12 @@ class DataProcessor:
                 
             # Check if company name is meaningful
             name = record.get('Name', '').strip()
-            if not name or name.lower() in ['unknown', 'n/a', '', 'null']:
+            if not name or name.lower() in self.INVALID_NAMES:
                 self.logger.debug(f"Invalid company name: {name}")
                 is_valid = False
                 
             # Check if source URL is valid (if present)
-            if 'Source_URL' in record and not self.validate_url(record['Source_URL']):
+            if check_source_url and 'Source_URL' in record and not self.validate_url(record['Source_URL']):
                 self.logger.debug(f"Invalid source URL: {record.get('Source_URL', '')}")
                 # Don't invalidate the record for this, just log it
                 
@@ -196,12 +264,13 @@ class DataProcessor:
         self.logger.info(f"Filtered out {len(records) - len(valid_records)} invalid records")
         return valid_records
         
-    def clean_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def clean_records(self, records: List[Dict[str, Any]], inplace: bool = False) -> List[Dict[str, Any]]:
         """
         Clean all records in the dataset.
         
         Args:
             records: List of record dictionaries
+            inplace: Mutate the given dicts instead of cleaning copies of them
             
         Returns:
             List of cleaned records
@@ -209,7 +278,7 @@ class DataProcessor:
         cleaned_records = []
         
         for record in records:
-            cleaned_record = record.copy()
+            cleaned_record = record if inplace else record.copy()
             
             # Clean company name
             if 'Name' in cleaned_record:
@@ -228,22 +297,82 @@ class DataProcessor:
             
         return cleaned_records
         
-    def process_scraped_data(self, records: List[Dict[str, Any]], 
+    def clean_records_vectorized(self, records: Union[List[Dict[str, Any]], pd.DataFrame]) -> List[Dict[str, Any]]:
+        """
+        Clean all records in a single DataFrame pass. Produces the same output
+        as clean_records, using pandas string operations instead of a per-row loop.
+        
+        Args:
+            records: List of record dictionaries, or a DataFrame with the same columns
+            
+        Returns:
+            List of cleaned records
+        """
+        if len(records) == 0:
+            return []
+            
+        df = self._clean_frame(pd.DataFrame(records))
+        return self._frame_to_records(df)
+        
+    def _clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the clean_records rules column-wise to a DataFrame of records.
+        """
+        # Clean company name
+        if 'Name' in df.columns:
+            names = df['Name']
+            unknown = names.isna() | names.str.lower().isin(self.PLACEHOLDER_VALUES)
+            names = names.str.replace(_WS_RE, ' ', regex=True).str.strip()
+            for pattern in _NOISE_PATTERNS:
+                names = names.str.replace(pattern, '', regex=True)
+            df['Name'] = names.str.strip().mask(unknown, 'Unknown')
+            
+        # Clean country
+        if 'Country' in df.columns:
+            df['Country'] = self._clean_country_series(df['Country'])
+            
+        # Clean email (basic cleanup)
+        if 'Email' in df.columns:
+            df['Email'] = df['Email'].str.strip().str.lower()
+            
+        return df
+        
+    def _frame_to_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        # Restore None for missing values so records match the row-wise path
+        df = df.astype(object).where(df.notna(), None)
+        return df.to_dict('records')
+        
+    def _clean_country_series(self, countries: pd.Series) -> pd.Series:
+        """
+        Vectorized equivalent of clean_country over a Series of raw country strings.
+        """
+        unknown = countries.isna() | countries.str.lower().isin(self.PLACEHOLDER_VALUES)
+        countries = countries.str.strip()
+        countries = countries.str.upper().map(self.COUNTRY_MAPPING).fillna(countries.str.title())
+        return countries.mask(unknown, 'Unknown')
+        
+    def process_scraped_data(self, records: Union[List[Dict[str, Any]], pd.DataFrame], 
                            remove_duplicates: bool = True,
-                           filter_invalid: bool = True) -> List[Dict[str, Any]]:
+                           filter_invalid: bool = True,
+                           inplace: bool = False) -> List[Dict[str, Any]]:
         """
         Args:
-            records: List of scraped record dictionaries
+            records: List of scraped record dictionaries, or a DataFrame with the same columns
             remove_duplicates: Whether to remove duplicate records
             filter_invalid: Whether to filter out invalid records
+            inplace: Allow the record dicts to be cleaned in place when the caller
+                no longer needs the raw values
             
         Returns:
             List of processed records
         """
         self.logger.info(f"Processing {len(records)} scraped records")
         
+        if isinstance(records, pd.DataFrame) or len(records) > self.VECTORIZE_THRESHOLD:
+            return self._process_frame(pd.DataFrame(records), remove_duplicates, filter_invalid)
+        
         # Step 1: Clean records
-        cleaned_records = self.clean_records(records)
+        cleaned_records = self.clean_records(records, inplace=inplace)
         self.logger.info(f"Cleaned {len(cleaned_records)} records")
         
         # Step 2: Filter invalid records
@@ -257,41 +386,204 @@ class DataProcessor:
         self.logger.info(f"Final processed dataset: {len(cleaned_records)} records")
         return cleaned_records
         
-    def save_to_csv(self, records: List[Dict[str, Any]], filename: str, 
-                   columns: List[str] = None) -> bool:
+    def _process_frame(self, df: pd.DataFrame, remove_duplicates: bool, 
+                       filter_invalid: bool) -> List[Dict[str, Any]]:
+        """
+        Clean, filter and deduplicate in one DataFrame pass, converting back to
+        record dicts only once at the end. Applies the same rules as
+        clean_records, filter_invalid_records and deduplicate_records.
+        """
+        if df.empty:
+            self.logger.info("Final processed dataset: 0 records")
+            return []
+            
+        df = self._clean_frame(df)
+        self.logger.info(f"Cleaned {len(df)} records")
+        
+        if filter_invalid:
+            names = df['Name'] if 'Name' in df.columns else pd.Series('', index=df.index)
+            invalid = names.fillna('').str.strip().str.lower().isin(self.INVALID_NAMES)
+            self.logger.info(f"Filtered out {int(invalid.sum())} invalid records")
+            df = df[~invalid]
+            
+        if remove_duplicates:
+            norm = df.reindex(columns=['Name', 'Email']).apply(
+                lambda col: col.fillna('').str.strip().str.lower())
+            duplicated = norm.duplicated(keep='first')
+            self.logger.info(f"Removed {int(duplicated.sum())} duplicate records")
+            df = df[~duplicated]
+            
+        self.logger.info(f"Final processed dataset: {len(df)} records")
+        return self._frame_to_records(df)
+        
+    def save_to_csv(self, records: Union[List[Dict[str, Any]], pd.DataFrame], filename: str, 
+                   columns: List[str] = None, schema: pa.Schema = None) -> bool:
         """
         Args:
-            records: List of record dictionaries
+            records: List of record dictionaries, or a DataFrame
             filename: Output filename
             columns: Specific columns to include (optional)
+            schema: Known Arrow schema of the records; inferred when omitted (optional)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            if not records:
+            if len(records) == 0:
                 self.logger.warning(f"No records to save to {filename}")
                 return False
                 
-            df = pd.DataFrame(records)
+            # Rows are streamed through the csv module rather than an Arrow table, so
+            # they are quoted and terminated as pandas' to_csv writes them; columns
+            # are ordered as a DataFrame built from the records would be
+            if schema is not None:
+                present = schema.names
+            elif isinstance(records, pd.DataFrame):
+                present = list(records.columns)
+            else:
+                present = list(dict.fromkeys(key for record in records for key in record))
+            fieldnames = [col for col in columns if col in present] if columns else present
+            return self.save_simple_csv(records, filename, fieldnames)
             
-            if columns:
-                # Ensure columns exist
-                existing_columns = [col for col in columns if col in df.columns]
-                df = df[existing_columns]
+        except Exception as e:
+            self.logger.error(f"Error saving to {filename}: {str(e)}")
+            return False
+            
+    def save_simple_csv(self, records: Union[List[Dict[str, Any]], pd.DataFrame], filename: str,
+                        fieldnames: List[str]) -> bool:
+        """
+        Write records with the stdlib csv module, streaming rows without
+        converting them to a DataFrame or Arrow table first.
+        
+        Args:
+            records: List of record dictionaries, or a DataFrame
+            filename: Output filename
+            fieldnames: Columns to write, in order
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if len(records) == 0:
+                self.logger.warning(f"No records to save to {filename}")
+                return False
                 
-            df.to_csv(filename, index=False)
-            self.logger.info(f"Saved {len(df)} records to {filename}")
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                if isinstance(records, pd.DataFrame):
+                    # Missing values are written as empty fields, like None below
+                    df = records.reindex(columns=fieldnames).astype(object)
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(fieldnames)
+                    writer.writerows(df.where(df.notna(), None).itertuples(index=False, name=None))
+                else:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+                    writer.writeheader()
+                    writer.writerows(records)
+                    
+            self.logger.info(f"Saved {len(records)} records to {filename}")
             return True
             
         except Exception as e:
             self.logger.error(f"Error saving to {filename}: {str(e)}")
             return False
             
-    def get_data_statistics(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def save_to_parquet(self, records: Union[List[Dict[str, Any]], pd.DataFrame], filename: str,
+                        columns: List[str] = None, batch_size: int = 1000,
+                        schema: pa.Schema = None) -> bool:
+        """
+        Writes records in row-group batches so only one batch is converted
+        to Arrow at a time.
+        
+        Args:
+            records: List of record dictionaries, or a DataFrame
+            filename: Output filename
+            columns: Specific columns to include (optional)
+            batch_size: Number of records per written batch
+            schema: Known Arrow schema of the records; inferred when omitted (optional)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if len(records) == 0:
+                self.logger.warning(f"No records to save to {filename}")
+                return False
+                
+            if schema is None:
+                schema = self._infer_schema(records[:batch_size], columns)
+            elif columns:
+                schema = pa.schema([schema.field(col) for col in columns if col in schema.names])
+            writer = self.open_writer(filename, schema)
+            try:
+                for start in range(0, len(records), batch_size):
+                    writer.write_batch(self._to_batch(records[start:start + batch_size], schema))
+            finally:
+                writer.close()
+                
+            self.logger.info(f"Saved {len(records)} records to {filename}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error saving to {filename}: {str(e)}")
+            return False
+            
+    def open_writer(self, filename: str, schema: pa.Schema) -> pq.ParquetWriter:
+        """
+        Opens a Parquet writer for incremental writes. The caller writes batches
+        with write_batch() and is responsible for closing it.
+        
+        Args:
+            filename: Output filename
+            schema: Arrow schema of the written batches
+            
+        Returns:
+            An open ParquetWriter
+        """
+        return pq.ParquetWriter(filename, schema, compression='snappy')
+        
+    def _infer_schema(self, records: Union[List[Dict[str, Any]], pd.DataFrame], 
+                      columns: List[str] = None) -> pa.Schema:
+        """
+        Infer an Arrow schema from a sample of records. Columns that are empty
+        in the sample are typed as strings so later batches can still fill them.
+        """
+        sample = self._records_to_table(records, columns).schema
+        return pa.schema([
+            pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+            for field in sample
+        ])
+        
+    def _to_batch(self, records: Union[List[Dict[str, Any]], pd.DataFrame], 
+                  schema: pa.Schema) -> pa.RecordBatch:
+        if isinstance(records, pd.DataFrame):
+            return pa.RecordBatch.from_pandas(records, schema=schema, preserve_index=False)
+        return pa.RecordBatch.from_pylist(records, schema=schema)
+        
+    def _records_to_table(self, records: Union[List[Dict[str, Any]], pd.DataFrame], 
+                          columns: List[str] = None, schema: pa.Schema = None) -> pa.Table:
+        """
+        Build an Arrow table from records, optionally restricted to the given columns.
+        Types are inferred from the data unless a schema is given.
+        """
+        if isinstance(records, pd.DataFrame):
+            table = pa.Table.from_pandas(records, schema=schema, preserve_index=False)
+        else:
+            table = pa.Table.from_pylist(records, schema=schema)
+        
+        if columns:
+            # Ensure columns exist
+            existing_columns = [col for col in columns if col in table.column_names]
+            table = table.select(existing_columns)
+            
+        return table
+            
+    def get_data_statistics(self, records: List[Dict[str, Any]], 
+                            already_deduped: bool = False) -> Dict[str, Any]:
         """
         Args:
             records: List of processed records
+            already_deduped: Whether records went through deduplicate_records, in which
+                case no fully duplicated rows can remain and the check is skipped
             
         Returns:
             Dictionary with statistics
@@ -299,14 +591,33 @@ class DataProcessor:
         if not records:
             return {'total_records': 0}
             
-        df = pd.DataFrame(records)
+        # A few aggregates only need one pass with sets and a Counter; missing
+        # values are skipped, as pandas' nunique/value_counts do
+        names = set()
+        emails = set()
+        countries = Counter()
+        for record in records:
+            names.add(record.get('Name'))
+            emails.add(record.get('Email'))
+            countries[record.get('Country')] += 1
+        names.discard(None)
+        emails.discard(None)
+        countries.pop(None, None)
+        
+        if already_deduped:
+            has_duplicates = False
+        else:
+            # Compare full rows over the union of keys, with absent keys as None
+            columns = tuple(set().union(*records))
+            rows = {tuple(map(record.get, columns)) for record in records}
+            has_duplicates = len(rows) != len(records)
         
         stats = {
-            'total_records': len(df),
-            'unique_companies': df['Name'].nunique() if 'Name' in df.columns else 0,
-            'unique_emails': df['Email'].nunique() if 'Email' in df.columns else 0,
-            'countries': df['Country'].value_counts().to_dict() if 'Country' in df.columns else {},
-            'has_duplicates': len(df) != len(df.drop_duplicates()),
+            'total_records': len(records),
+            'unique_companies': len(names),
+            'unique_emails': len(emails),
+            'countries': dict(countries.most_common()),
+            'has_duplicates': has_duplicates,
         }
             
         return stats
@@ -326,55 +637,48 @@ class DataProcessor:
         total_profiles = len(raw_details)
         
         # --- Identify Notable Cases ---
-        no_website = [d['name'] for d in raw_details if d.get('name') and not d.get('website')]
-        emails_on_main = [d['name'] for d in raw_details if d.get('name') and d.get('email_source') == 'main_page']
+        names = np.array([d.get('name') for d in raw_details], dtype=object)
+        has_name = np.array([bool(d.get('name')) for d in raw_details], dtype=bool)
+        has_website = np.array([bool(d.get('website')) for d in raw_details], dtype=bool)
+        on_main_page = np.array([d.get('email_source') == 'main_page' for d in raw_details], dtype=bool)
+        no_emails = np.array([not e['emails'] for e in raw_emails], dtype=bool)
+
+        no_website = names[has_name & ~has_website].tolist()
+        emails_on_main = names[has_name & on_main_page].tolist()
         
         # A company has no email found if its website was scraped but the corresponding email list is empty.
-        no_email_found = [
-            details['name']
-            for i, details in enumerate(raw_details)
-            if details.get('name') and details.get('website') and not raw_emails[i]['emails']
-        ]
+        no_email_found = names[has_name & has_website & no_emails].tolist()
 
         # --- Calculate Final Statistics ---
-        companies_with_email = sum(1 for e in raw_emails if e['emails'])
-        
-        country_counts = {}
-        for d in raw_details:
-            country = d.get('country')
-            if country:
-                cleaned_country = self.clean_country(country)
-                country_counts[cleaned_country] = country_counts.get(cleaned_country, 0) + 1
+        companies_with_email = int((~no_emails).sum())
+        
+        countries = [d.get('country') for d in raw_details if d.get('country')]
+        country_counts = Counter(self._clean_country_series(pd.Series(countries, dtype=object)) if countries else [])
 
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.write("--- Scraping Summary ---\n\n")
-            f.write(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"End Time:   {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Duration:   {str(duration).split('.')[0]}\n\n") # Format to remove microseconds
-            f.write(f"Scraped {pages_scraped} pages and found {total_profiles} company profiles.\n\n")
-            
-            f.write("\n--- Final Statistics ---\n")
-            f.write(f"Total companies with at least one email found: {companies_with_email} / {total_profiles}\n")
-            
-            f.write("\nCountry Frequency:\n")
-            if country_counts:
-                sorted_countries = sorted(country_counts.items(), key=lambda item: item[1], reverse=True)
-                for country, count in sorted_countries:
-                    f.write(f"- {country}: {count}\n")
-            else:
-                f.write("No country data available.\n")
+        # Build the whole report in memory and write it with a single call
+        buf = [
+            "--- Scraping Summary ---\n\n",
+            f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"End Time:   {end_time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Duration:   {str(duration).split('.')[0]}\n\n", # Format to remove microseconds
+            f"Scraped {pages_scraped} pages and found {total_profiles} company profiles.\n\n",
+            "\n--- Final Statistics ---\n",
+            f"Total companies with at least one email found: {companies_with_email} / {total_profiles}\n",
+            "\nCountry Frequency:\n",
+        ]
+        if country_counts:
+            buf.extend(f"- {country}: {count}\n" for country, count in country_counts.most_common())
+        else:
+            buf.append("No country data available.\n")
 
-            f.write("--- Notable Cases ---\n")
-            f.write(f"Companies with no website link: {len(no_website)}\n")
-            if no_website:
-                f.write("\n".join(f"- {name}" for name in no_website[:10]) + "\n") # Show a few examples
-                if len(no_website) > 10: f.write("...\n")
+        buf.append("--- Notable Cases ---\n")
+        buf.append(f"Companies with no website link: {len(no_website)}\n")
+        buf.extend(f"- {name}\n" for name in no_website[:10]) # Show a few examples
+        if len(no_website) > 10: buf.append("...\n")
 
-            f.write(f"\nCompanies with no email found on their site: {len(no_email_found)}\n")
-            if no_email_found:
-                f.write("\n".join(f"- {name}" for name in no_email_found[:10]) + "\n")
-                if len(no_email_found) > 10: f.write("...\n")
+        buf.append(f"\nCompanies with no email found on their site: {len(no_email_found)}\n")
+        buf.extend(f"- {name}\n" for name in no_email_found[:10])
+        if len(no_email_found) > 10: buf.append("...\n")
 
-            
-                 
+        Path(log_path).write_text(''.join(buf), encoding='utf-8')
         self.logger.info(f"Summary log generated at {log_path}")
\ No newline at end of file
@@ -4,34 +4,118 @@ Email extraction utilities for finding and validating email addresses.
 
 import re
 import logging
-from typing import List, Set, Dict, Optional
+from functools import lru_cache
+from typing import List, Set, Dict, Optional, Union
 from urllib.parse import urljoin, urlparse
-import validators
 
 from bs4 import BeautifulSoup
 
 
+# Common business email domains (prioritize these)
+_BUSINESS_DOMAINS = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
+    'icloud.com', 'me.com', 'live.com', 'msn.com', 'ymail.com'
+})
+
+# Common prefixes that indicate business emails
+_BUSINESS_PREFIXES = frozenset({
+    'info', 'contact', 'sales', 'support', 'admin', 'office',
+    'hello', 'enquiry', 'inquiry', 'business', 'service',
+    'mail', 'reception', 'booking', 'reservation', 'export',
+    'order', 'purchase', 'commercial', 'wholesale', 'retail',
+    'marketing', 'press', 'media', 'hr', 'careers', 'jobs',
+    'webmaster', 'postmaster', 'hostmaster', 'billing'
+})
+# Distinct prefix lengths, so a prefix match is a few slice-and-lookup checks
+_BUSINESS_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _BUSINESS_PREFIXES}))
+
+# Email patterns found in page text, most common first
+_EMAIL_PATTERNS = (
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Standard email
+    r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b',  # With spaces
+    r'\b[A-Za-z0-9._%+-]+\[at\][A-Za-z0-9.-]+\[dot\][A-Z|a-z]{2,}\b',  # Obfuscated
+    r'\b[A-Za-z0-9._%+-]+\s*\(at\)\s*[A-Za-z0-9.-]+\s*\(dot\)\s*[A-Z|a-z]{2,}\b',  # Obfuscated with parentheses
+)
+# All patterns in one alternation so the text is scanned once, compiled once per process
+_COMBINED_EMAIL_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _EMAIL_PATTERNS), re.IGNORECASE)
+
+# Strict address shape: dot-separated local part, hostname labels that don't
+# start or end with a hyphen, alphabetic TLD. Scraped text is noisy, so extraction
+# is stricter than DataProcessor's _LOOSE_EMAIL_RE check on already extracted emails.
+_STRICT_EMAIL_RE = re.compile(
+    r'[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*'
+    r'@(?:[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?\.)+[A-Za-z]{2,}'
+)
+
+# clean_email: HTML tags, then obfuscated separators and whitespace in a single pass
+_TAG_RE = re.compile(r'<[^>]+>')
+_OBFUSCATION_RE = re.compile(r'\[at\]|\(at\)|\[dot\]|\(dot\)|\s+')
+_OBFUSCATION_REPLACEMENTS = {'[at]': '@', '(at)': '@', '[dot]': '.', '(dot)': '.'}
+_STRIP_CHARS = '.,;:!?()[]{}"\'-'
+
+
+def _replace_obfuscation(match: re.Match) -> str:
+    # Anything not in the table is whitespace, which is dropped
+    return _OBFUSCATION_REPLACEMENTS.get(match.group(), '')
+
+
+# The same contact emails recur across many pages, and the score depends only
+# on the email and the frozen sets above, so results are memoized.
+@lru_cache(maxsize=8192)
+def _score_email_business_relevance(email: str) -> float:
+    local_part, domain = email.split('@')
+    local_part = local_part.lower()
+    domain = domain.lower()
+    
+    score = 0.5  # Base score
+    
+    # Business-like prefixes increase score
+    if any(local_part[:length] in _BUSINESS_PREFIXES for length in _BUSINESS_PREFIX_LENGTHS):
+        score += 0.3
+            
+    # Personal email domains decrease score
+    if domain in _BUSINESS_DOMAINS:
+        score -= 0.2
+        
+    # Company domain (not free email) increases score
+    elif domain not in _BUSINESS_DOMAINS:
+        score += 0.2
+        
+    # Avoid obvious test/fake emails
+    if any(word in local_part for word in ['test', 'fake', 'example', 'noreply', 'no-reply']):
+        score -= 0.4
+        
+    # Prefer shorter, professional local parts
+    if len(local_part) <= 10:
+        score += 0.1
+    elif len(local_part) > 20:
+        score -= 0.1
+        
+    return max(0.0, min(1.0, score))
+
+
 class EmailExtractor:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Common email regex patterns
-        self.email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Standard email
-            r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b',  # With spaces
-            r'\b[A-Za-z0-9._%+-]+\[at\][A-Za-z0-9.-]+\[dot\][A-Z|a-z]{2,}\b',  # Obfuscated
-            r'\b[A-Za-z0-9._%+-]+\s*\(at\)\s*[A-Za-z0-9.-]+\s*\(dot\)\s*[A-Z|a-z]{2,}\b',  # Obfuscated with parentheses
-        ]
+        # Common email regex patterns, shared by every instance
+        self.email_patterns = list(_EMAIL_PATTERNS)
+        self.combined_pattern = _COMBINED_EMAIL_RE
         
-        # Compile patterns for efficiency
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.email_patterns]
+        # Elements that commonly contain emails
+        self.email_selectors = [
+            '.contact-email', '.email', '.contact-info', '.footer-contact',
+            '[class*="email"]', '[class*="contact"]', '[id*="email"]',
+            '[id*="contact"]', 'address', '.footer', '.company-email',
+            '.business-email', '.support-email', '.info-email',
+            '[data-type="email"]', '[data-field="email"]',
+            '.contact-details', '.business-details', '.company-details'
+        ]
+        self.email_selector = ', '.join(self.email_selectors)
         
         # Common business email domains (prioritize these)
-        self.business_domains = {
-            'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
-            'icloud.com', 'me.com', 'live.com', 'msn.com', 'ymail.com'
-        }
+        self.business_domains = _BUSINESS_DOMAINS
         
         # Domains to exclude (usually not business emails)
         self.excluded_domains = {
@@ -74,14 +158,7 @@ class EmailExtractor:
         }
         
         # Common prefixes that indicate business emails
-        self.business_prefixes = {
-            'info', 'contact', 'sales', 'support', 'admin', 'office',
-            'hello', 'enquiry', 'inquiry', 'business', 'service',
-            'mail', 'reception', 'booking', 'reservation', 'export',
-            'order', 'purchase', 'commercial', 'wholesale', 'retail',
-            'marketing', 'press', 'media', 'hr', 'careers', 'jobs',
-            'webmaster', 'postmaster', 'hostmaster', 'billing'
-        }
+        self.business_prefixes = _BUSINESS_PREFIXES
 
     def _deduplicate_parsing_errors(self, emails: Set[str]) -> Set[str]:
         """
@@ -92,87 +169,74 @@ class EmailExtractor:
         if not emails:
             return emails
 
-        # Create a copy to iterate over while modifying the original set
-        emails_to_check = list(emails)
-        to_remove = set()
-
-        for email1 in emails_to_check:
-            if email1 in to_remove:
-                continue
-
-            try:
-                local1, domain1 = email1.split('@', 1)
-            except ValueError:
+        # Split each email once and index local parts by domain, so each
+        # candidate is checked with set lookups instead of against every other email
+        split_emails = []
+        locals_by_domain: Dict[str, Set[str]] = {}
+        for email in emails:
+            if '@' not in email:
                 continue
+            local, domain = email.split('@', 1)
+            split_emails.append((email, local, domain))
+            locals_by_domain.setdefault(domain, set()).add(local)
 
-            for email2 in emails_to_check:
-                if email1 == email2:
-                    continue
-                
-                try:
-                    local2, domain2 = email2.split('@', 1)
-                except ValueError:
-                    continue
-
-                # Check if they are for the same domain
-                if domain1 == domain2:
-                    # Is local1 a superset of local2 with a numeric prefix?
-                    if len(local1) > len(local2) and local1.endswith(local2):
-                        prefix = local1[:-len(local2)]
-                        if prefix.isdigit():
-                            self.logger.debug(f"Found parsing error. Removing '{email1}' because correct version '{email2}' also exists.")
-                            to_remove.add(email1)
+        to_remove = set()
+        for email, local, domain in split_emails:
+            domain_locals = locals_by_domain[domain]
+            # Try every split of the leading digits, e.g. '123info' -> '23info', '3info', 'info'
+            for i in range(1, len(local)):
+                if not local[i - 1].isdigit():
+                    break
+                if local[i:] in domain_locals:
+                    self.logger.debug(f"Found parsing error. Removing '{email}' because correct version '{local[i:]}@{domain}' also exists.")
+                    to_remove.add(email)
+                    break
         
         return emails - to_remove
         
     def extract_emails_from_text(self, text: str) -> Set[str]:
         emails = set()
+        # Raw matches already handled; the same address often repeats across a
+        # page, and cleaning it again would give the same result
+        seen = set()
         
-        for pattern in self.compiled_patterns:
-            matches = pattern.findall(text)
-            for match in matches:
-                # Clean up the email
-                email = self.clean_email(match)
-                if email and self.is_valid_email(email):
-                    emails.add(email.lower())
+        for match in self.combined_pattern.findall(text):
+            if match in seen:
+                continue
+            seen.add(match)
+            email = self._clean_and_validate(match)
+            if email:
+                emails.add(email)
                     
         return emails
         
-    def extract_emails_from_html(self, html: str, base_url: str = None) -> Set[str]:
+    def extract_emails_from_html(self, html: Union[str, BeautifulSoup], base_url: str = None) -> Set[str]:
         emails = set()
-        soup = BeautifulSoup(html, 'lxml')
+        # Callers that already parsed the page pass the soup to skip a second parse
+        soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, 'lxml')
         
-        # Extract from mailto links
-        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
+        # Extract from mailto links; the attribute selector matches natively instead
+        # of running a regex callback per <a>
+        mailto_links = soup.select('a[href^="mailto:" i]')
         for link in mailto_links:
             href = link.get('href', '')
-            email_match = re.search(r'mailto:([^?&]+)', href, re.I)
-            if email_match:
-                email = self.clean_email(email_match.group(1))
-                if email and self.is_valid_email(email):
-                    emails.add(email.lower())
+            # Drop the 'mailto:' scheme and any ?subject=... or &cc=... suffix
+            email = self._clean_and_validate(href[7:].split('?', 1)[0].split('&', 1)[0])
+            if email:
+                emails.add(email)
         
         # Extract from text content, using a separator to prevent words from merging
         text_content = soup.get_text(separator=' ')
         text_emails = self.extract_emails_from_text(text_content)
         emails.update(text_emails)
         
-        # Extract from specific elements that commonly contain emails
-        email_selectors = [
-            '.contact-email', '.email', '.contact-info', '.footer-contact',
-            '[class*="email"]', '[class*="contact"]', '[id*="email"]',
-            '[id*="contact"]', 'address', '.footer', '.company-email',
-            '.business-email', '.support-email', '.info-email',
-            '[data-type="email"]', '[data-field="email"]',
-            '.contact-details', '.business-details', '.company-details'
-        ]
-        
-        for selector in email_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                element_text = element.get_text(separator=' ')
-                element_emails = self.extract_emails_from_text(element_text)
-                emails.update(element_emails)
+        # Extract from specific elements that commonly contain emails. One select()
+        # walks the tree once and returns each matching element once, even when
+        # it matches several of the selectors.
+        for element in soup.select(self.email_selector):
+            element_text = element.get_text(separator=' ')
+            element_emails = self.extract_emails_from_text(element_text)
+            emails.update(element_emails)
                 
         # Post-process the final set to remove likely parsing errors
         final_emails = self._deduplicate_parsing_errors(emails)
@@ -192,22 +256,31 @@ class EmailExtractor:
         if not email:
             return None
             
-        # Aggressively remove anything that looks like an HTML tag or is inside angle brackets
-        email = re.sub(r'<[^>]+>', '', email)
-
-        # Remove whitespace
-        email = email.strip()
+        # Aggressively remove anything that looks like an HTML tag or is inside angle brackets.
+        # Kept as its own step since removing a tag can join an obfuscated '[at]'.
+        if '<' in email:
+            email = _TAG_RE.sub('', email)
         
-        # Handle obfuscated emails
-        email = email.replace('[at]', '@').replace('(at)', '@')
-        email = email.replace('[dot]', '.').replace('(dot)', '.')
-        email = re.sub(r'\s+', '', email)  # Remove all whitespace
+        # Handle obfuscated emails and remove all whitespace. Without brackets
+        # there is nothing to de-obfuscate, so plain addresses skip the regex;
+        # str.split() breaks on the same Unicode whitespace that \s matches.
+        if '[' in email or '(' in email:
+            email = _OBFUSCATION_RE.sub(_replace_obfuscation, email)
+        else:
+            email = ''.join(email.split())
         
         # Remove common unwanted characters
-        email = email.strip('.,;:!?()[]{}"\'-')
+        email = email.strip(_STRIP_CHARS)
         
         return email if email else None
         
+    def _clean_and_validate(self, raw: str) -> Optional[str]:
+        """Returns the cleaned, lowercased email, or None if it is not valid."""
+        email = self.clean_email(raw)
+        if email and self.is_valid_email(email):
+            return email.lower()
+        return None
+        
     def is_valid_email(self, email: str) -> bool:
         """
         Validate email address.
@@ -221,8 +294,8 @@ class EmailExtractor:
         if not email or '@' not in email:
             return False
             
-        # Use validators library for basic validation
-        if not validators.email(email):
+        # Basic shape check with a precompiled regex
+        if not _STRICT_EMAIL_RE.fullmatch(email):
             return False
             
         # Extract domain
@@ -242,37 +315,7 @@ class EmailExtractor:
         if not email:
             return 0.0
             
-        local_part, domain = email.split('@')
-        local_part = local_part.lower()
-        domain = domain.lower()
-        
-        score = 0.5  # Base score
-        
-        # Business-like prefixes increase score
-        for prefix in self.business_prefixes:
-            if local_part.startswith(prefix):
-                score += 0.3
-                break
-                
-        # Personal email domains decrease score
-        if domain in self.business_domains:
-            score -= 0.2
-            
-        # Company domain (not free email) increases score
-        elif domain not in self.business_domains:
-            score += 0.2
-            
-        # Avoid obvious test/fake emails
-        if any(word in local_part for word in ['test', 'fake', 'example', 'noreply', 'no-reply']):
-            score -= 0.4
-            
-        # Prefer shorter, professional local parts
-        if len(local_part) <= 10:
-            score += 0.1
-        elif len(local_part) > 20:
-            score -= 0.1
-            
-        return max(0.0, min(1.0, score))
+        return _score_email_business_relevance(email)
         
     def filter_business_emails(self, emails: Set[str], min_score: float = 0.3) -> List[str]:
         """
@@ -297,13 +340,14 @@ class EmailExtractor:
         
         return [email for email, score in scored_emails]
         
-    def extract_and_filter_emails(self, content: str, content_type: str = 'html', 
+    def extract_and_filter_emails(self, content: Union[str, BeautifulSoup], content_type: str = 'html', 
                                  base_url: str = None, min_score: float = 0.3) -> List[str]:
         """
         Main method to extract and filter emails from content.
         
         Args:
-            content: Content to extract from (HTML or text)
+            content: Content to extract from (HTML or text), or an already parsed
+                BeautifulSoup of the HTML
             content_type: 'html' or 'text'
             base_url: Base URL for HTML content
             min_score: Minimum business relevance score
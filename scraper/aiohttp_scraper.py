@@ -0,0 +1,168 @@
+import aiohttp
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Any, Dict, List, Tuple
+import logging
+import random
+
+from processor.email_extractor import EmailExtractor
+from scraper.common import add_profile_links, find_contact_page
+from scraper.http_cache import cache_ttl_from_config, fetch_cached_async
+
+# A failed page is logged and skipped, never allowed to abort the whole scrape
+_FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError)
+
+# Listing pages only need their links, so the rest of the DOM is not built
+_ONLY_LINKS = SoupStrainer('a')
+
+class AiohttpScraper:
+    def __init__(
+        self,
+        portal: str,
+        config: Dict[str, Any],
+        sector: str,
+        max_pages: int,
+        **kwargs  # Accept headless and other params but ignore them
+    ):
+        self.portal = portal
+        self.config = config
+        self.sector = sector
+        self.max_pages = max_pages
+        self.max_concurrency = config.get("max_concurrency", 20)
+        self.cache_ttl = cache_ttl_from_config(config)
+        self.email_extractor = EmailExtractor()
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def _random_delay(self):
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+
+    def scrape(self) -> Dict[str, Any]:
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self) -> Dict[str, Any]:
+        connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            company_profiles, pages_scraped = await self.extract_company_profiles(session)
+            details, emails = await self.extract_details_and_emails(session, company_profiles)
+        return {
+            "company_profiles": company_profiles,
+            "details": details,
+            "emails": emails,
+            "pages_scraped": pages_scraped,
+        }
+
+    async def _fetch_text(self, session: aiohttp.ClientSession, url: str, timeout: int) -> str:
+        """Returns the page HTML, from the disk cache when enabled and fresh."""
+        async def get(url: str) -> str:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
+                # Pages without a charset header aren't always UTF-8; bad bytes become U+FFFD
+                text = await response.text(errors='replace')
+            await self._random_delay()
+            return text
+
+        return await fetch_cached_async(url, self.cache_ttl, get)
+
+    async def extract_company_profiles(self, session: aiohttp.ClientSession) -> Tuple[List[str], int]:
+        # Pagination stays sequential since each page tells us whether a next one exists
+        links = set()
+        base_url = self.config["base_url"]
+        search_path_template = base_url + self.config["search_path_template"]
+        current_page = 1
+
+        while current_page <= self.max_pages:
+            page_url = search_path_template.format(sector=self.sector, page=current_page)
+            self.logger.info(f"Scraping page {current_page}: {page_url}")
+            try:
+                html = await self._fetch_text(session, page_url, timeout=10)
+
+                soup = BeautifulSoup(html, 'lxml', parse_only=_ONLY_LINKS)
+                company_elements = soup.select(self.config["selectors"]["company_profiles"])
+                next_page_element = soup.select_one(self.config["selectors"]["next_page"])
+                if not company_elements or not next_page_element:
+                    # The selectors may depend on non-link ancestors; confirm on the full page
+                    soup = BeautifulSoup(html, 'lxml')
+                    company_elements = soup.select(self.config["selectors"]["company_profiles"])
+                    next_page_element = soup.select_one(self.config["selectors"]["next_page"])
+                print(f"Found {len(company_elements)} company profiles on page {current_page}")
+
+                if not add_profile_links(links, (element.get("href") for element in company_elements), base_url):
+                    self.logger.warning(f"No new company profiles on page {current_page}, stopping scraping")
+                    break
+
+                if not next_page_element:
+                    self.logger.warning(f"No next page found on page {current_page}, stopping scraping")
+                    break
+                current_page += 1
+            except _FETCH_ERRORS as e:
+                self.logger.error(f"Failed to fetch {page_url}: {e}")
+                break
+        return list(links), current_page - 1
+
+    async def extract_details_and_emails(self, session: aiohttp.ClientSession, company_profiles: List[str]) -> Tuple[List[Dict[str, str]], List[Dict[str, List[str]]]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # gather preserves the order of company_profiles
+        results = await asyncio.gather(
+            *(self._process_single_profile(session, semaphore, url) for url in company_profiles)
+        )
+
+        details = [res_details for res_details, _ in results]
+        emails = [res_emails for _, res_emails in results]
+        return details, emails
+
+    async def _process_single_profile(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, profile_url: str) -> Tuple[Dict, Dict]:
+        """Coroutine for each profile. Bounded by the shared semaphore."""
+        profile_details = {'name': None, 'address': None, 'country': None, 'website': None, 'email_source': 'not_found'}
+        website_emails = {'emails': []}
+
+        async with semaphore:
+            print(f"Visiting company profile: {profile_url}")
+            try:
+                html = await self._fetch_text(session, profile_url, timeout=10)
+
+                soup = BeautifulSoup(html, 'lxml')
+
+                name_selector = self.config["selectors"]["company_name"]
+                address_selector = self.config["selectors"]["company_address"]
+                country_selector = self.config["selectors"]["country"]
+                website_selector = self.config["selectors"]["website_links"]
+
+                if name_el := soup.select_one(name_selector): profile_details['name'] = name_el.text.strip()
+                if address_el := soup.select_one(address_selector): profile_details['address'] = address_el.text.strip()
+                if country_el := soup.select_one(country_selector): profile_details['country'] = country_el.text.strip()
+
+                website_url = None
+                if website_el := soup.select_one(website_selector):
+                    website_url = website_el.get('href')
+                    profile_details['website'] = website_url
+
+                if website_url:
+                    try:
+                        website_html = await self._fetch_text(session, website_url, timeout=15)
+                        # Parsed once for both the email extraction and the contact page search
+                        website_soup = BeautifulSoup(website_html, 'lxml')
+
+                        found_emails = self.email_extractor.extract_and_filter_emails(website_soup, 'html', website_url)
+                        if found_emails:
+                            profile_details['email_source'] = 'main_page'
+
+                        if not found_emails:
+                            contact_page_url = find_contact_page(website_soup, website_url)
+                            if contact_page_url:
+                                self.logger.info(f"Found contact page: {contact_page_url}")
+                                contact_html = await self._fetch_text(session, contact_page_url, timeout=15)
+                                found_emails = self.email_extractor.extract_and_filter_emails(contact_html, 'html', contact_page_url)
+                                if found_emails:
+                                    profile_details['email_source'] = 'contact_page'
+
+                        website_emails['emails'] = found_emails
+                    except _FETCH_ERRORS as e:
+                        self.logger.error(f"Could not fetch company website {website_url}: {e}")
+
+            except _FETCH_ERRORS as e:
+                self.logger.error(f"Could not fetch profile {profile_url}: {e}")
+
+        return profile_details, website_emails
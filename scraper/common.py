@@ -0,0 +1,53 @@
+"""
+Helpers shared by the scraper engines.
+"""
+
+import re
+from typing import Iterable, Optional, Set
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+# Link texts that point to a website's contact page
+CONTACT_KEYWORDS = ('contact', 'kontakt', 'iletişim', 'contacto', 'contatto')
+# Matched against the lowercased link text, in one scan instead of one per keyword
+_CONTACT_RE = re.compile('|'.join(CONTACT_KEYWORDS))
+
+
+def find_contact_page(soup: BeautifulSoup, base_url: str) -> Optional[str]:
+    """
+    Args:
+        soup: Parsed page of a company website
+        base_url: URL the page was loaded from, for resolving relative links
+
+    Returns:
+        URL of the first link whose text names a contact page, or None
+    """
+    for link in soup.select('a[href]'):
+        if _CONTACT_RE.search(link.get_text(strip=True).lower()):
+            return urljoin(base_url, link['href'])
+    return None
+
+
+def add_profile_links(links: Set[str], hrefs: Iterable[Optional[str]], base_url: str) -> bool:
+    """
+    Adds the company profile links found on one listing page to links.
+
+    Args:
+        links: Profile URLs collected so far, updated in place
+        hrefs: href of every profile link on the page; relative ones are resolved
+            against base_url and empty ones skipped
+        base_url: Portal base URL
+
+    Returns:
+        Whether the page added any new profile. A portal that keeps serving the
+        same results would otherwise be paged to max_pages, so callers stop once
+        this is False.
+    """
+    links_before = len(links)
+    for profile_url in hrefs:
+        if profile_url and not profile_url.startswith("http"):
+            profile_url = urljoin(base_url, profile_url)
+        if profile_url:
+            links.add(profile_url)
+    return len(links) > links_before
@@ -0,0 +1,124 @@
+"""
+On-disk cache for fetched page HTML, keyed by URL.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+CACHE_DIR = Path(".cache")
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(url: str) -> Path:
+    digest = hashlib.blake2b(url.encode("utf-8")).hexdigest()
+    return CACHE_DIR / digest[:2] / digest
+
+
+def read_cached(url: str, ttl: int) -> Optional[str]:
+    """
+    Args:
+        url: URL the page was fetched from
+        ttl: Maximum age of the cached entry in seconds
+
+    Returns:
+        Cached page HTML, or None if missing or expired
+    """
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, "rb") as f:
+            content = f.read().decode("utf-8")
+    except OSError:
+        return None
+    logger.debug(f"Cache hit for {url}")
+    return content
+
+
+def write_cached(url: str, content: str) -> None:
+    """
+    Stores page HTML atomically. Each write goes to its own temporary file,
+    so concurrent writers never interleave and a crashed writer leaves no
+    entry blocked.
+
+    Args:
+        url: URL the page was fetched from
+        content: Page HTML
+    """
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except OSError as e:
+        logger.warning(f"Could not write cache entry for {url}: {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8", errors="replace"))
+        # The last writer wins; readers only ever see a complete file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry for {url}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def rendered_cache_key(url: str) -> str:
+    """
+    Returns the cache key for a page as rendered by a browser. Rendered pages are
+    kept apart from the HTTP responses of the same URL, which the HTTP engines
+    read and the Selenium engine checks for JavaScript-rendered content.
+    """
+    return f"rendered:{url}"
+
+
+def cache_ttl_from_config(config: Dict[str, Any]) -> int:
+    """
+    Returns:
+        Seconds to reuse pages cached on disk from earlier runs, from the portal's
+        "http_cache_ttl" setting; 0 disables the cache
+    """
+    return config.get("http_cache_ttl", 0)
+
+
+def fetch_cached(url: str, ttl: int, fetch: Callable[[str], str]) -> str:
+    """
+    Returns the page HTML from the cache when enabled and fresh, otherwise from
+    fetch(url), storing the result. fetch only runs on a cache miss, so anything
+    it does besides the request, such as a politeness delay, only applies to
+    real network requests.
+
+    Args:
+        url: URL of the page
+        ttl: Maximum age of a cached entry in seconds; 0 disables the cache
+        fetch: Downloads the page HTML, raising on failure
+    """
+    if ttl:
+        cached = read_cached(url, ttl)
+        if cached is not None:
+            return cached
+    content = fetch(url)
+    if ttl:
+        write_cached(url, content)
+    return content
+
+
+async def fetch_cached_async(url: str, ttl: int, fetch: Callable[[str], Awaitable[str]]) -> str:
+    """Coroutine counterpart of fetch_cached, for an async fetch."""
+    if ttl:
+        cached = read_cached(url, ttl)
+        if cached is not None:
+            return cached
+    content = await fetch(url)
+    if ttl:
+        write_cached(url, content)
+    return content
@@ -1,13 +1,42 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from typing import Any, Dict, List, Tuple
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from io import BytesIO
+from lxml import etree
+import cssselect
+from cssselect.parser import Attrib, Class, Element, Hash
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 import logging
+import threading
 import time
 import random
-import re
 
 from processor.email_extractor import EmailExtractor
+from scraper.common import add_profile_links, find_contact_page
+from scraper.http_cache import cache_ttl_from_config, fetch_cached
+
+
+def _compile_element_test(css: str) -> Optional[etree.XPath]:
+    """
+    Compiles a CSS selector into an XPath test against a single element.
+
+    Returns None if the selector depends on anything other than the element's own
+    tag and attributes (combinators, pseudo-classes), since those can't be
+    checked while the page is still being parsed.
+    """
+    for selector in cssselect.parse(css):
+        if selector.pseudo_element:
+            return None
+        node = selector.parsed_tree
+        while not isinstance(node, Element):
+            if not isinstance(node, (Attrib, Class, Hash)):
+                return None
+            node = node.selector
+    return etree.XPath(cssselect.GenericTranslator().css_to_xpath(css, prefix="self::"))
+
 
 class RequestsScraper:
     def __init__(
@@ -22,8 +51,24 @@ class RequestsScraper:
         self.config = config
         self.sector = sector
         self.max_pages = max_pages
+        self.cache_ttl = cache_ttl_from_config(config)
+        self.max_concurrency = config.get("max_concurrency", 8)
+        # Requests in flight to any single host, so concurrency doesn't hammer one site
+        self.per_host_concurrency = config.get("per_host_concurrency", 2)
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+        # Normalized website URL -> (emails, email_source), shared by the worker threads
+        self._website_cache: Dict[Tuple[str, str, str], Tuple[List[str], str]] = {}
+        self._website_cache_lock = threading.Lock()
         self.email_extractor = EmailExtractor()
+        # Listing pages are stream-parsed when both selectors can be checked per element
+        self._profile_link_test = _compile_element_test(config["selectors"]["company_profiles"])
+        self._next_page_test = _compile_element_test(config["selectors"]["next_page"])
         self.session = requests.Session()
+        # One pooled connection per worker thread instead of urllib3's default of 10
+        adapter = HTTPAdapter(pool_maxsize=max(self.max_concurrency, 10))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         })
@@ -32,6 +77,27 @@ class RequestsScraper:
     def _random_delay(self):
         time.sleep(random.uniform(0.5, 1.5))
 
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._host_semaphores[host] = threading.Semaphore(self.per_host_concurrency)
+        return semaphore
+
+    def _fetch(self, url: str, timeout: int) -> str:
+        """Returns the page HTML, from the disk cache when enabled and fresh."""
+        return fetch_cached(url, self.cache_ttl, partial(self._get, timeout=timeout))
+
+    def _get(self, url: str, timeout: int) -> str:
+        # The politeness delay runs while holding the host's slot, so it throttles
+        # that host only and other threads keep fetching from other sites
+        with self._host_semaphore(url):
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            self._random_delay()
+        return response.text
+
     def scrape(self) -> Dict[str, Any]:
         company_profiles, pages_scraped = self.extract_company_profiles()
         details, emails = self.extract_details_and_emails(company_profiles)
@@ -52,23 +118,16 @@ class RequestsScraper:
             page_url = search_path_template.format(sector=self.sector, page=current_page)
             self.logger.info(f"Scraping page {current_page}: {page_url}")
             try:
-                response = self.session.get(page_url, timeout=10)
-                response.raise_for_status()
-                self._random_delay()
+                html = self._fetch(page_url, timeout=10)
                 
-                soup = BeautifulSoup(response.text, 'lxml')
-                company_elements = soup.select(self.config["selectors"]["company_profiles"])
-                print(f"Found {len(company_elements)} company profiles on page {current_page}")
-
-                for element in company_elements:
-                    profile_url = element.get("href")
-                    if profile_url and not profile_url.startswith("http"):
-                        profile_url = urljoin(base_url, profile_url)
-                    if profile_url and profile_url not in links:
-                        links.add(profile_url)
-
-                next_page_element = soup.select_one(self.config["selectors"]["next_page"])
-                if not next_page_element:
+                profile_hrefs, has_next_page = self._parse_listing(html)
+                print(f"Found {len(profile_hrefs)} company profiles on page {current_page}")
+
+                if not add_profile_links(links, profile_hrefs, base_url):
+                    self.logger.warning(f"No new company profiles on page {current_page}, stopping scraping")
+                    break
+
+                if not has_next_page:
                     self.logger.warning(f"No next page found on page {current_page}, stopping scraping")
                     break
                 current_page += 1
@@ -77,71 +136,128 @@ class RequestsScraper:
                 break
         return list(links), current_page - 1
 
+    def _parse_listing(self, html: str) -> Tuple[List[Optional[str]], bool]:
+        """
+        Returns the href of every company profile link on a listing page, and
+        whether the page has a next-page link.
+        """
+        if self._profile_link_test is None or self._next_page_test is None:
+            soup = BeautifulSoup(html, 'lxml')
+            company_elements = soup.select(self.config["selectors"]["company_profiles"])
+            has_next_page = soup.select_one(self.config["selectors"]["next_page"]) is not None
+            return [element.get("href") for element in company_elements], has_next_page
+
+        # Check each element as soon as its end tag is parsed, then free it and the
+        # siblings already checked before it, so the full DOM is never held in memory
+        hrefs = []
+        has_next_page = False
+        try:
+            for _, element in etree.iterparse(BytesIO(html.encode("utf-8")), events=("end",),
+                                              html=True, encoding="utf-8"):
+                if self._profile_link_test(element):
+                    hrefs.append(element.get("href"))
+                if not has_next_page and self._next_page_test(element):
+                    has_next_page = True
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError:
+            # Raised for documents without any elements, e.g. an empty body
+            pass
+        return hrefs, has_next_page
+
     def extract_details_and_emails(self, company_profiles: List[str]) -> Tuple[List[Dict[str, str]], List[Dict[str, List[str]]]]:
-        details = []
-        emails = []
+        total = len(company_profiles)
+        if total == 0:
+            return [], []
+
+        # Results are written by index so the output order matches company_profiles
+        details = [None] * total
+        emails = [None] * total
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, total)) as executor:
+            futures = {
+                executor.submit(self._fetch_profile, profile_url): index
+                for index, profile_url in enumerate(company_profiles)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                details[index], emails[index] = future.result()
 
-        for profile_url in company_profiles:
-            print(f"Visiting company profile: {profile_url}")
-            profile_details = {'name': None, 'address': None, 'country': None, 'website': None, 'email_source': 'not_found'}
-            website_emails = {'emails': []}
+        return details, emails
+
+    def _fetch_profile(self, profile_url: str) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Scrapes one company profile and its website. Runs in a worker thread."""
+        print(f"Visiting company profile: {profile_url}")
+        profile_details = {'name': None, 'address': None, 'country': None, 'website': None, 'email_source': 'not_found'}
+        website_emails = {'emails': []}
+        
+        try:
+            html = self._fetch(profile_url, timeout=10)
+
+            soup = BeautifulSoup(html, 'lxml')
             
-            try:
-                response = self.session.get(profile_url, timeout=10)
-                response.raise_for_status()
-                self._random_delay()
+            name_selector = self.config["selectors"]["company_name"]
+            address_selector = self.config["selectors"]["company_address"]
+            country_selector = self.config["selectors"]["country"]
+            website_selector = self.config["selectors"]["website_links"]
 
-                soup = BeautifulSoup(response.text, 'lxml')
-                
-                name_selector = self.config["selectors"]["company_name"]
-                address_selector = self.config["selectors"]["company_address"]
-                country_selector = self.config["selectors"]["country"]
-                website_selector = self.config["selectors"]["website_links"]
-
-                if name_el := soup.select_one(name_selector): profile_details['name'] = name_el.text.strip()
-                if address_el := soup.select_one(address_selector): profile_details['address'] = address_el.text.strip()
-                if country_el := soup.select_one(country_selector): profile_details['country'] = country_el.text.strip()
-
-                website_url = None
-                if website_el := soup.select_one(website_selector):
-                    website_url = website_el.get('href')
-                    profile_details['website'] = website_url
-
-                if website_url:
-                    try:
-                        web_response = self.session.get(website_url, timeout=15)
-                        web_response.raise_for_status()
-                        self._random_delay()
-                        
-                        found_emails = self.email_extractor.extract_and_filter_emails(web_response.text, 'html', website_url)
-                        if found_emails:
-                            profile_details['email_source'] = 'main_page'
-                        
-                        if not found_emails:
-                            # Search for contact page links on the website's soup
-                            contact_keywords = ['contact', 'kontakt', 'iletişim', 'contacto', 'contatto']
-                            contact_page_url = None
-                            for keyword in contact_keywords:
-                                contact_link = soup.find('a', text=re.compile(keyword, re.I))
-                                if contact_link and contact_link.get('href'):
-                                    contact_page_url = urljoin(website_url, contact_link['href'])
-                                    self.logger.info(f"Found contact page: {contact_page_url}")
-                                    break
-                            
-                            if contact_page_url:
-                                contact_response = self.session.get(contact_page_url, timeout=15)
-                                found_emails = self.email_extractor.extract_and_filter_emails(contact_response.text, 'html', contact_page_url)
-                                if found_emails:
-                                    profile_details['email_source'] = 'contact_page'
-
-                        website_emails['emails'] = found_emails
-                    except requests.RequestException as e:
-                        self.logger.error(f"Could not fetch company website {website_url}: {e}")
+            if name_el := soup.select_one(name_selector): profile_details['name'] = name_el.text.strip()
+            if address_el := soup.select_one(address_selector): profile_details['address'] = address_el.text.strip()
+            if country_el := soup.select_one(country_selector): profile_details['country'] = country_el.text.strip()
 
-            except requests.RequestException as e:
-                self.logger.error(f"Could not fetch profile {profile_url}: {e}")
+            website_url = None
+            if website_el := soup.select_one(website_selector):
+                website_url = website_el.get('href')
+                profile_details['website'] = website_url
 
-            details.append(profile_details)
-            emails.append(website_emails)
+            if website_url:
+                try:
+                    website_emails['emails'], profile_details['email_source'] = self._website_emails(website_url)
+                except requests.RequestException as e:
+                    self.logger.error(f"Could not fetch company website {website_url}: {e}")
+
+        except requests.RequestException as e:
+            self.logger.error(f"Could not fetch profile {profile_url}: {e}")
+
+        return profile_details, website_emails
+
+    def _website_emails(self, website_url: str) -> Tuple[List[str], str]:
+        """
+        Returns the emails found on a company website and where they were found.
+        Profiles of the same company group often share a website, so results are
+        reused for every profile pointing at the same site.
+        """
+        # Keyed on the whole site URL, not just the host, since many companies only
+        # list a page on a shared host (social networks, site builders)
+        parts = urlparse(website_url)
+        cache_key = (parts.netloc.lower().removeprefix('www.'), parts.path.rstrip('/'), parts.query)
+        if parts.netloc:
+            with self._website_cache_lock:
+                cached = self._website_cache.get(cache_key)
+            if cached is not None:
+                found_emails, email_source = cached
+                return list(found_emails), email_source
+
+        email_source = 'not_found'
+        website_html = self._fetch(website_url, timeout=15)
+        # Parsed once for both the email extraction and the contact page search
+        website_soup = BeautifulSoup(website_html, 'lxml')
         
-        return details, emails
+        found_emails = self.email_extractor.extract_and_filter_emails(website_soup, 'html', website_url)
+        if found_emails:
+            email_source = 'main_page'
+        
+        if not found_emails:
+            contact_page_url = find_contact_page(website_soup, website_url)
+            if contact_page_url:
+                self.logger.info(f"Found contact page: {contact_page_url}")
+                contact_html = self._fetch(contact_page_url, timeout=15)
+                found_emails = self.email_extractor.extract_and_filter_emails(contact_html, 'html', contact_page_url)
+                if found_emails:
+                    email_source = 'contact_page'
+
+        if parts.netloc:
+            with self._website_cache_lock:
+                self._website_cache[cache_key] = (found_emails, email_source)
+        return list(found_emails), email_source
@@ -4,9 +4,20 @@ import random
 import os
 from selenium import webdriver
 from bs4 import BeautifulSoup
+import lxml.html
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Requests the scraper never reads from: web fonts, media and tracking/ad scripts
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    "*facebook.net*", "*hotjar*",
+]
+
 class SeleniumHandler:
     def __init__(self):
         self.driver = None
@@ -24,11 +35,18 @@ class SeleniumHandler:
         """Parses HTML content using BeautifulSoup."""
         return BeautifulSoup(html_content, 'lxml')
 
+    def parse_tree(self, html_content: str) -> lxml.html.HtmlElement:
+        """Parses HTML content into an lxml tree, for pages read with precompiled selectors."""
+        # Encoded first, since lxml rejects str input that carries an XML encoding declaration
+        return lxml.html.document_fromstring(html_content.encode('utf-8', errors='replace'), parser=_HTML_PARSER)
+
     def setup_driver(self, headless: bool = True) -> webdriver.Chrome:
         """
         Sets up the Chrome WebDriver using Selenium's built-in driver manager.
         """
         options = Options()
+        # Return from driver.get() at DOMContentLoaded; callers wait for the elements they need
+        options.page_load_strategy = 'eager'
         if headless:
             options.add_argument('--headless')
 
@@ -46,9 +64,27 @@ class SeleniumHandler:
         # Redirect chromedriver service logs to null device
         service = Service(log_path=os.devnull)
 
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Commands reuse one keep-alive connection to chromedriver. Each driver is only
+        # driven from a single thread, so the default pool size of 1 never blocks.
+        self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        # Lookups must fail immediately; every wait in the scrapers is an explicit WebDriverWait
+        self.driver.implicitly_wait(0)
+
+        # Drop fonts, media and trackers before they are downloaded
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         return self.driver
 
+    def reset_driver(self):
+        """
+        Clears all cookies and leaves the current page, so a reused driver starts
+        the next URL in the same state as a freshly launched one.
+        """
+        if self.driver:
+            # delete_all_cookies() only covers the current page's domain
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            self.driver.get('about:blank')
+
     def close_driver(self):
         """
         Closes the WebDriver.
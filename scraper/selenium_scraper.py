@@ -1,19 +1,117 @@
-from typing import Any, Dict, List, Tuple, Generator
-from urllib.parse import urljoin
+from typing import Any, Dict, List, Optional, Tuple, Generator
+from urllib.parse import urljoin, urlparse
 import pandas as pd
-import re
-import time
 import random
-import concurrent.futures
+import multiprocessing
+from multiprocessing.util import Finalize
+import asyncio
 
+import aiohttp
+from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from scraper.common import add_profile_links, find_contact_page
+from scraper.http_cache import cache_ttl_from_config, fetch_cached_async, read_cached, rendered_cache_key, write_cached
 from scraper.selenium_handler import SeleniumHandler
 from processor.email_extractor import EmailExtractor
 
 
+# A page fetched over plain HTTP without emails and with less body text than
+# this is probably rendered by JavaScript, so it is loaded in the browser instead
+_MIN_STATIC_TEXT_LENGTH = 200
+# Mount points that single-page apps fill in with JavaScript
+_APP_ROOT_SELECTOR = '#root, #app, #__next, #__nuxt, app-root'
+
+
+# Reads the profile fields in the browser and returns only their text, in one WebDriver
+# command. Text is joined like BeautifulSoup's get_text(separator=' ', strip=True):
+# trimmed text nodes, script and style contents left out.
+_PROFILE_FIELDS_SCRIPT = """
+const [fieldSelectors, websiteSelector] = arguments;
+const elementText = element => {
+    const parts = [];
+    const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        if (node.parentElement.closest('script, style, template')) continue;
+        const text = node.data.trim();
+        if (text) parts.push(text);
+    }
+    return parts.join(' ');
+};
+const website = document.querySelector(websiteSelector);
+return {
+    fields: fieldSelectors.map(selector => {
+        const element = document.querySelector(selector);
+        return element ? elementText(element) : null;
+    }),
+    website: website ? website.getAttribute('href') : null,
+    url: location.href,
+};
+"""
+
+
+def _empty_profile() -> Tuple[Dict, Dict]:
+    """Returns the details and emails of a profile that could not be scraped."""
+    return {'name': None, 'address': None, 'country': None, 'website': None, 'email_source': 'not_found'}, {'emails': []}
+
+
+def _website_key(url: str) -> Tuple[str, str, str]:
+    """
+    Identifies a company website regardless of scheme, 'www.' prefix and trailing
+    slash. Keyed on the whole URL rather than the host, since many companies only
+    have a page on a shared host (social networks, site builders).
+    """
+    parts = urlparse(url)
+    if not parts.netloc:
+        return '', url, ''
+    return parts.netloc.lower().removeprefix('www.'), parts.path.rstrip('/'), parts.query
+
+
+# Per-process state for the profile worker pool. Each worker process owns one
+# scraper copy and one long-lived WebDriver, created once by _init_worker.
+_worker_scraper = None
+_worker_handler = None
+
+
+def _init_worker(portal: str, config: Dict[str, Any], sector: str, max_pages: int, headless: bool):
+    global _worker_scraper, _worker_handler
+    # Built from plain arguments so only the config dict is pickled into each worker
+    _worker_scraper = SeleniumScraper(portal, config, sector, max_pages, headless)
+    _worker_handler = SeleniumHandler()
+    try:
+        _worker_handler.setup_driver(headless=headless)
+    except Exception as e:
+        # Raising here would make the pool respawn workers forever; profiles
+        # handled by this worker will log errors instead.
+        _worker_handler.logger.error(f"Could not start WebDriver in worker process: {e}")
+    # Quit the driver when the worker process exits after pool.close()/join()
+    Finalize(_worker_handler, _worker_handler.close_driver, exitpriority=10)
+
+
+def _scrape_profile(url_info: Tuple[int, str, int]) -> Tuple[int, Dict, Dict]:
+    index = url_info[0]
+    details, emails = _worker_scraper._process_single_profile(url_info, _worker_handler)
+    try:
+        # Don't carry cookies or page state over to the next profile on this driver
+        _worker_handler.reset_driver()
+    except WebDriverException as e:
+        _worker_handler.logger.warning(f"Could not reset WebDriver after {url_info[1]}: {e.msg}")
+    return index, details, emails
+
+
+def _scrape_website(target: Tuple[int, str]) -> Tuple[int, List[str], str]:
+    index, website_url = target
+    found_emails, email_source = _worker_scraper._harvest_website_in_browser(website_url, _worker_handler)
+    try:
+        _worker_handler.reset_driver()
+    except WebDriverException as e:
+        _worker_handler.logger.warning(f"Could not reset WebDriver after {website_url}: {e.msg}")
+    return index, found_emails, email_source
+
+
 class SeleniumScraper:
     def __init__(
         self,
@@ -28,7 +126,33 @@ class SeleniumScraper:
         self.max_pages = max_pages
         self.headless = headless
         self.config = config
+        # Listing pages are read with a selector compiled once, straight on the lxml tree
+        selectors = config["selectors"]
+        self._profile_links = CSSSelector(selectors["company_profiles"], translator='html')
+        # Selector strings handed to the driver
+        self._profile_selector = selectors["company_profiles"]
+        self._next_page_selector = selectors["next_page"]
+        self._name_selector = selectors["company_name"]
+        self._website_selector = selectors["website_links"]
+        # WLW reveals the website link only after its <button> counterpart is clicked
+        self._website_button_selector = self._website_selector.replace('a.', 'button.', 1)
+        # Profile fields read by _PROFILE_FIELDS_SCRIPT, with their log labels
+        self._profile_fields = (('name', 'Company name'), ('address', 'Address'), ('country', 'Country'))
+        self._profile_field_selectors = [selectors["company_name"], selectors["company_address"], selectors["country"]]
+        # Average pause in seconds between portal page loads; 0 disables it
+        self.request_delay = config.get("delay_between_requests", 0)
         self.email_extractor = EmailExtractor()
+        # Company websites and contact pages rarely need JavaScript, so they are
+        # fetched over plain HTTP, this many at a time, before falling back to the browser
+        self.max_concurrency = config.get("max_concurrency", 50)
+        # Seconds to wait for the next result from the browser workers before one of
+        # them is considered stuck, e.g. after its process died mid-task
+        self.task_timeout = config.get("task_timeout", 300)
+        # Company websites and contact pages share the disk cache of the HTTP engines
+        self.cache_ttl = cache_ttl_from_config(config)
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
         # The main handler is now used only for logging and utility, not for a shared driver
         self.logger = SeleniumHandler().logger 
 
@@ -69,7 +193,7 @@ class SeleniumScraper:
                     page_url = search_path_template.format(sector=self.sector, page=current_page)
 
                 self.logger.info(f"Scraping page {current_page} for portal {self.portal}")
-                handler.random_delay()
+                self._polite_delay(handler)
                 
                 # Only call driver.get() if we have a new URL to navigate to.
                 if not (self.portal == 'wlw' and current_page > 1):
@@ -77,31 +201,26 @@ class SeleniumScraper:
 
                 try:
                     WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, self.config["selectors"]["company_profiles"]))
+                        EC.presence_of_element_located((By.CSS_SELECTOR, self._profile_selector))
                     )
                 except TimeoutException:
                     self.logger.warning(f"Timeout waiting for company links on page {current_page}")
                     break
                 
-                soup = handler.parse_html(driver.page_source)
-                company_elements = soup.select(self.config["selectors"]["company_profiles"])
+                company_elements = self._profile_links(handler.parse_tree(driver.page_source))
                 
                 if not company_elements and current_page == 1:
                     self.logger.warning(f"No company profiles found on the first page for sector '{self.sector}'. Stopping.")
                     break
 
                 print(f"Found {len(company_elements)} company profiles on page {current_page}")
-                for element in company_elements:
-                    profile_url = element.get("href")
-                    if profile_url and not profile_url.startswith("http"):
-                        profile_url = urljoin(base_url, profile_url)
-                    if profile_url and profile_url not in links:
-                        links.add(profile_url)
+                if not add_profile_links(links, (element.get("href") for element in company_elements), base_url):
+                    self.logger.warning(f"No new company profiles on page {current_page}, stopping scraping.")
+                    break
                 
                 # After scraping, try to move to the next page
                 try:
-                    next_page_selector = self.config["selectors"]["next_page"]
-                    next_page_element = driver.find_element(By.CSS_SELECTOR, next_page_selector)
+                    next_page_element = driver.find_element(By.CSS_SELECTOR, self._next_page_selector)
                     
                     # For wlw, we must click to paginate
                     if self.portal == 'wlw':
@@ -118,18 +237,21 @@ class SeleniumScraper:
                 break
         return list(links), current_page -1
 
-    def _process_single_profile(self, url_info: Tuple[int, str, int]) -> Tuple[Dict, Dict]:
-        """Worker function for each thread. Scrapes a single company profile."""
+    def _polite_delay(self, handler: SeleniumHandler):
+        """Pauses before loading a portal page, if the portal config asks for it."""
+        if self.request_delay:
+            handler.random_delay(self.request_delay * 0.5, self.request_delay * 1.5)
+
+    def _process_single_profile(self, url_info: Tuple[int, str, int], handler: SeleniumHandler) -> Tuple[Dict, Dict]:
+        """Scrapes the details of a single company profile using the worker's already running driver."""
         index, profile_url, total = url_info
-        thread_handler = SeleniumHandler()
-        profile_details = {'name': None, 'address': None, 'country': None, 'website': None, 'email_source': 'not_found'}
-        website_emails = {'emails': []}
+        profile_details, website_emails = _empty_profile()
         
         try:
-            driver = thread_handler.setup_driver(headless=self.headless)
+            driver = handler.driver
             print(f"Visiting company profile [{index}/{total}]: {profile_url}")
+            self._polite_delay(handler)
             driver.get(profile_url)
-            thread_handler.random_delay()
 
             # Handle cookie consent banner which may overlay other elements
             try:
@@ -139,119 +261,286 @@ class SeleniumScraper:
                 )
                 accept_button.click()
                 self.logger.info(f"Accepted cookie banner on {profile_url}")
-                time.sleep(2)  # Wait for banner to disappear
+                # Wait for the banner to disappear, for no longer than it takes
+                WebDriverWait(driver, 5).until(
+                    EC.invisibility_of_element_located((By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"))
+                )
             except TimeoutException:
                 self.logger.info(f"No cookie banner found on {profile_url}, proceeding.")
 
             # --- Extract details from profile page ---
-            name_selector = self.config["selectors"]["company_name"]
-            address_selector = self.config["selectors"]["company_address"]
-            country_selector = self.config["selectors"]["country"]
-            website_selector = self.config["selectors"]["website_links"]
-            try:
-                name_element = WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, name_selector)))
-                profile_details['name'] = name_element.text
-            except TimeoutException: self.logger.warning(f"Company name not found on {profile_url}")
+            # Wait once for the profile to render, then read every field with a single
+            # script instead of transferring and parsing the whole page source
             try:
-                address_element = WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, address_selector)))
-                profile_details['address'] = address_element.text
-            except TimeoutException: self.logger.warning(f"Address not found on {profile_url}")
-            try:
-                country_element = WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, country_selector)))
-                profile_details['country'] = country_element.text
-            except TimeoutException: self.logger.warning(f"Country not found on {profile_url}")
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, self._name_selector)))
+            except TimeoutException:
+                pass  # Reported as a missing name below
+            if self.portal != "wlw":
+                # The website link can render after the name; it is read by the same script
+                try:
+                    WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, self._website_selector)))
+                except TimeoutException:
+                    pass  # Reported as a missing website link below
+            profile = driver.execute_script(_PROFILE_FIELDS_SCRIPT, self._profile_field_selectors, self._website_selector)
+            for (field, label), text in zip(self._profile_fields, profile['fields']):
+                if text is not None:
+                    profile_details[field] = text
+                else:
+                    self.logger.warning(f"{label} not found on {profile_url}")
             
-            # --- Get website and extract emails ---
+            # --- Get website link; its emails are harvested once all profiles are done ---
             website_url = None
             try:
                 if self.portal == "wlw":
                     # For 'wlw', we need to click a button to reveal the website link (<a> tag).
                     # The initial element is a <button>, which then becomes an <a> tag.
-                    # We derive the button selector from the configured link selector.
-                    link_selector = self.config["selectors"]["website_links"]
-                    button_selector = link_selector.replace('a.', 'button.', 1)
-
                     # 1. Find and click the button.
                     website_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, button_selector))
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, self._website_button_selector))
                     )
                     website_button.click()
                     
                     # 2. Now wait for the <a> tag to be present and get the href.
                     website_element = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, link_selector))
+                        EC.presence_of_element_located((By.CSS_SELECTOR, self._website_selector))
                     )
+                    website_url = website_element.get_attribute('href')
                 else:
-                    website_element = WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, website_selector)))
+                    # The link was read along with the other fields
+                    if profile['website']:
+                        website_url = urljoin(profile['url'], profile['website'])
                 
-                website_url = website_element.get_attribute('href')
-                profile_details['website'] = website_url
+                if website_url:
+                    profile_details['website'] = website_url
+                else:
+                    self.logger.warning(f"Website link not found on {profile_url}")
             except TimeoutException: self.logger.warning(f"Website link not found on {profile_url}")
 
-            if website_url:
-                try:
-                    driver.get(website_url)
-                    # Wait for the page to be fully loaded, especially for JS-heavy sites
-                    WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    thread_handler.random_delay()
-                    page_source = driver.page_source
-                    found_emails = self.email_extractor.extract_and_filter_emails(page_source, 'html', website_url)
-                    if found_emails:
-                        profile_details['email_source'] = 'main_page'
-
-                    if not found_emails:
-                        contact_keywords = ['contact', 'kontakt', 'iletişim', 'contacto', 'contatto']
-                        contact_page_url = None
-                        for keyword in contact_keywords:
-                            try:
-                                contact_link = driver.find_element(By.XPATH, f"//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{keyword}')]")
-                                contact_page_url = contact_link.get_attribute('href')
-                                if contact_page_url:
-                                    if not contact_page_url.startswith('http'):
-                                        contact_page_url = urljoin(website_url, contact_page_url)
-                                    break
-                            except NoSuchElementException: continue
-                        if contact_page_url:
-                            driver.get(contact_page_url)
-                            # Wait for the contact page to be fully loaded
-                            WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                            thread_handler.random_delay()
-                            page_source = driver.page_source
-                            found_emails = self.email_extractor.extract_and_filter_emails(page_source, 'html', contact_page_url)
-                            if found_emails:
-                                profile_details['email_source'] = 'contact_page'
-
-                    website_emails['emails'] = found_emails
-                except WebDriverException as e:
-                    if "net::ERR_NAME_NOT_RESOLVED" in e.msg:
-                        self.logger.warning(f"Could not resolve domain name for {website_url}. The website may be down or incorrect. Skipping.")
-                    else:
-                        # Log other, unexpected WebDriver errors more verbosely but without crashing
-                        self.logger.error(f"A WebDriver error occurred for {website_url}: {e.msg}")
-                except Exception as e: self.logger.error(f"An unexpected error occurred while scraping emails from {website_url}: {e}")
-
         except Exception as e:
             self.logger.error(f"Error processing profile {profile_url}: {e}")
-        finally:
-            thread_handler.close_driver()
             
         return profile_details, website_emails
 
+    async def _harvest_emails_async(self, website_urls: List[str]) -> List[Optional[Tuple[List[str], str]]]:
+        """
+        Fetches all company websites over plain HTTP concurrently and extracts their emails.
+
+        Returns:
+            (emails, email_source) per website, or None where the site has to be
+            loaded in a browser instead
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            # gather preserves the order of website_urls
+            return await asyncio.gather(
+                *(self._harvest_website_async(session, semaphore, url) for url in website_urls)
+            )
+
+    async def _harvest_website_async(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                     website_url: str) -> Optional[Tuple[List[str], str]]:
+        async with semaphore:
+            # One malformed site must not abort the harvest of all the others
+            try:
+                page = await self._fetch_static_async(session, website_url)
+                if page is None:
+                    return None
+                # Emails are looked for in the static HTML first; short pages such as
+                # contact pages often have them in plain markup
+                soup, page_url = page
+                found_emails = self.email_extractor.extract_and_filter_emails(soup, 'html', website_url)
+                if found_emails:
+                    return found_emails, 'main_page'
+
+                contact_page_url = find_contact_page(soup, page_url)
+                if not contact_page_url:
+                    return None if self._needs_browser(soup, website_url) else ([], 'not_found')
+                page = await self._fetch_static_async(session, contact_page_url)
+                if page is None:
+                    return None
+                contact_soup, _ = page
+                found_emails = self.email_extractor.extract_and_filter_emails(contact_soup, 'html', contact_page_url)
+                if found_emails:
+                    return found_emails, 'contact_page'
+                return None if self._needs_browser(contact_soup, contact_page_url) else ([], 'not_found')
+            except Exception as e:
+                self.logger.error(f"Error harvesting emails from {website_url} over HTTP, it will be loaded in the browser: {e}")
+                return None
+
+    async def _fetch_static_async(self, session: aiohttp.ClientSession,
+                                  url: str) -> Optional[Tuple[BeautifulSoup, str]]:
+        """
+        Returns the parsed page and the final URL after redirects, or None if the
+        request fails.
+        """
+        page_url = url  # Cached pages are resolved against the URL they were requested with
+
+        async def get(url: str) -> str:
+            nonlocal page_url
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                page_source = await response.text()
+                page_url = str(response.url)
+            return page_source
+
+        try:
+            page_source = await fetch_cached_async(url, self.cache_ttl, get)
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e:
+            self.logger.info(f"Plain HTTP fetch of {url} failed ({e}), it will be loaded in the browser")
+            return None
+        return BeautifulSoup(page_source, 'lxml'), page_url
+
+    def _needs_browser(self, soup: BeautifulSoup, url: str) -> bool:
+        """
+        Called for static pages without emails; True if the page is probably
+        rendered by JavaScript and has to be loaded in the browser instead.
+        """
+        body = soup.body
+        looks_rendered = (
+            not body
+            or len(body.get_text(strip=True)) < _MIN_STATIC_TEXT_LENGTH
+            # e.g. "You need to enable JavaScript to run this app."
+            or any('javascript' in noscript.get_text().lower() for noscript in body.find_all('noscript'))
+            or any(not root.get_text(strip=True) for root in body.select(_APP_ROOT_SELECTOR))
+        )
+        if looks_rendered:
+            self.logger.info(f"{url} looks rendered by JavaScript, it will be loaded in the browser")
+        return looks_rendered
+
+    def _harvest_website_in_browser(self, website_url: str, handler: SeleniumHandler) -> Tuple[List[str], str]:
+        """Extracts emails from a company website with the worker's browser."""
+        try:
+            _, soup, page_url = self._load_in_browser(website_url, handler)
+            found_emails = self.email_extractor.extract_and_filter_emails(soup, 'html', website_url)
+            if found_emails:
+                return found_emails, 'main_page'
+
+            contact_page_url = find_contact_page(soup, page_url)
+            if contact_page_url:
+                _, contact_soup, _ = self._load_in_browser(contact_page_url, handler)
+                found_emails = self.email_extractor.extract_and_filter_emails(contact_soup, 'html', contact_page_url)
+                if found_emails:
+                    return found_emails, 'contact_page'
+        except WebDriverException as e:
+            if "net::ERR_NAME_NOT_RESOLVED" in e.msg:
+                self.logger.warning(f"Could not resolve domain name for {website_url}. The website may be down or incorrect. Skipping.")
+            else:
+                # Log other, unexpected WebDriver errors more verbosely but without crashing
+                self.logger.error(f"A WebDriver error occurred for {website_url}: {e.msg}")
+        except Exception as e: self.logger.error(f"An unexpected error occurred while scraping emails from {website_url}: {e}")
+        return [], 'not_found'
+
+    def _load_in_browser(self, url: str, handler: SeleniumHandler) -> Tuple[str, BeautifulSoup, str]:
+        """
+        Returns:
+            The page HTML, its parsed soup, and the final URL after redirects
+        """
+        cache_key = rendered_cache_key(url)
+        if self.cache_ttl:
+            # A page rendered by an earlier run doesn't need the browser again
+            page_source = read_cached(cache_key, self.cache_ttl)
+            if page_source is not None:
+                return page_source, handler.parse_html(page_source), url
+        driver = handler.driver
+        driver.get(url)
+        # Wait for the page to be fully loaded, especially for JS-heavy sites
+        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        page_source = driver.page_source
+        if self.cache_ttl:
+            write_cached(cache_key, page_source)
+        return page_source, handler.parse_html(page_source), driver.current_url
+
+    @staticmethod
+    def _assign_website_emails(indices: List[int], found_emails: List[str], email_source: str,
+                               details: List[Dict], emails: List[Dict]):
+        """Stores one website's result on every profile that links to it."""
+        for i in indices:
+            # Each profile gets its own list, so editing one record never changes another
+            emails[i]['emails'], details[i]['email_source'] = list(found_emails), email_source
+
+    def _pool_results(self, results, count: int, task: str) -> Generator:
+        """
+        Yields count results from a pool.imap_unordered iterator as they arrive. The
+        result of a worker that dies mid-task never arrives, so this stops early
+        once no result has come in for task_timeout seconds.
+        """
+        for received in range(count):
+            try:
+                yield results.next(timeout=self.task_timeout)
+            except multiprocessing.TimeoutError:
+                self.logger.error(f"No {task} finished within {self.task_timeout}s, a browser worker is stuck. "
+                                  f"Skipping the remaining {count - received}.")
+                return
+
     def extract_details_and_emails_parallel(self, company_profiles: List[str]) -> Tuple[List[Dict[str, str]], List[Dict[str, List[str]]]]:
-        details = []
-        emails = []
         total_profiles = len(company_profiles)
+        details = [None] * total_profiles
+        emails = [None] * total_profiles
+        if not company_profiles:
+            return details, emails
+
         # Create a list of tuples with (index, url, total) for the worker
         urls_with_info = [(i + 1, url, total_profiles) for i, url in enumerate(company_profiles)]
 
-        # Using max_workers=7 as a default, can be made configurable
-        with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
-            # map preserves the order of the input list
-            results = list(executor.map(self._process_single_profile, urls_with_info))
+        # Selenium is not thread-safe, so each worker is a separate process owning one driver
+        workers = min(self.config.get("workers", 7), total_profiles)
+        pool = multiprocessing.Pool(processes=workers, initializer=_init_worker,
+                                    initargs=(self.portal, self.config, self.sector, self.max_pages, self.headless))
+        healthy = False
+        try:
+            # 1. Profile pages need the browser. Results arrive out of order; the
+            # index puts them back in place.
+            done = 0
+            for index, res_details, res_emails in self._pool_results(
+                    pool.imap_unordered(_scrape_profile, urls_with_info), len(urls_with_info), "company profile"):
+                details[index - 1] = res_details
+                emails[index - 1] = res_emails
+                done += 1
+            for i, profile_details in enumerate(details):
+                if profile_details is None:
+                    # Lost to a stuck worker
+                    details[i], emails[i] = _empty_profile()
+
+            # 2. Company websites are fetched over plain HTTP, all concurrently. Profiles of
+            # the same company group often share a site, so each site is fetched once and
+            # its result handed to every profile pointing at it.
+            sites = {}
+            for i, profile_details in enumerate(details):
+                website_url = profile_details['website']
+                if website_url:
+                    try:
+                        key = _website_key(website_url)
+                    except ValueError:
+                        # e.g. an invalid IPv6 host; such a link is only shared verbatim
+                        key = website_url
+                    sites.setdefault(key, (website_url, []))[1].append(i)
+            targets = list(sites.values())
+            print(f"Harvesting emails from {len(targets)} company websites")
+            results = asyncio.run(self._harvest_emails_async([url for url, _ in targets]))
 
-        for res_details, res_emails in results:
-            details.append(res_details)
-            emails.append(res_emails)
+            # 3. Only websites that failed over HTTP or need JavaScript go back to the browsers
+            browser_targets = []
+            for site, ((website_url, indices), result) in enumerate(zip(targets, results)):
+                if result is None:
+                    browser_targets.append((site, website_url))
+                else:
+                    self._assign_website_emails(indices, *result, details, emails)
+            if browser_targets:
+                print(f"Loading {len(browser_targets)} company websites in the browser")
+            for site, found_emails, email_source in self._pool_results(
+                    pool.imap_unordered(_scrape_website, browser_targets), len(browser_targets), "company website"):
+                self._assign_website_emails(targets[site][1], found_emails, email_source, details, emails)
+                done += 1
+            # A missing result means a stuck worker, which would keep join from returning
+            healthy = done == len(urls_with_info) + len(browser_targets)
+        finally:
+            if healthy:
+                # close/join (not terminate) lets each worker run its driver finalizer
+                pool.close()
+            else:
+                # After an error or a stuck worker, the queued browser tasks
+                # aren't worth waiting for
+                pool.terminate()
+            pool.join()
             
         return details, emails
-        
\ No newline at end of file